@@ -18,6 +18,7 @@ from robot.model import Statistics
 
 from .executionerrors import ExecutionErrors
 from .model import TestSuite
+from .suiteteardownfailed import SuiteTeardownFailureHandler
 
 
 class Result:
@@ -119,10 +120,18 @@ class Result:
         """
         visitor.visit_result(self)
 
-    def handle_suite_teardown_failures(self):
-        """Internal usage only."""
-        if self.generated_by_robot:
+    def handle_suite_teardown_failures(self, suites=None):
+        """Internal usage only.
+
+        If ``suites`` is given, only those suites are handled. Otherwise all
+        suites are checked.
+        """
+        if not self.generated_by_robot:
+            return
+        if suites is None:
             self.suite.handle_suite_teardown_failures()
+        else:
+            SuiteTeardownFailureHandler().handle_suites(suites)
 
     def set_execution_mode(self, other):
         """Set execution mode based on other result. Internal usage only."""
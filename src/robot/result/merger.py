@@ -24,8 +24,14 @@ class Merger(SuiteVisitor):
         self.result = result
         self.current = None
         self.rpa = rpa
+        # Test indices by name in the current suite. Avoids finding tests
+        # by looping, which made merging large suites quadratic.
+        self._test_indices = {}
+        self._test_indices_suite = None
 
     def merge(self, merged):
+        # Results may have been modified after the previous merge.
+        self._test_indices_suite = None
         self.result.set_execution_mode(merged)
         merged.suite.visit(self)
         self.result.errors.add(merged.errors)
@@ -64,16 +70,28 @@ class Merger(SuiteVisitor):
         self.current = self.current.parent
 
     def visit_test(self, test):
-        old = self._find(self.current.tests, test.name)
-        if old is None:
+        tests = self.current.tests
+        indices = self._get_test_indices()
+        index = indices.get(test.name)
+        if index is None:
             test.message = self._create_add_message(test)
-            self.current.tests.append(test)
+            indices[test.name] = len(tests)
+            tests.append(test)
         elif test.skipped:
+            old = tests[index]
             old.message = self._create_skip_message(old, test)
         else:
-            test.message = self._create_merge_message(test, old)
-            index = self.current.tests.index(old)
-            self.current.tests[index] = test
+            test.message = self._create_merge_message(test, tests[index])
+            tests[index] = test
+
+    def _get_test_indices(self):
+        if self._test_indices_suite is not self.current:
+            self._test_indices = {}
+            for index, test in enumerate(self.current.tests):
+                # With duplicate names the first test is used.
+                self._test_indices.setdefault(test.name, index)
+            self._test_indices_suite = self.current
+        return self._test_indices
 
     def _create_add_message(self, item, suite=False):
         item_type = 'Suite' if suite else test_or_task('Test', self.rpa)
@@ -13,8 +13,9 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from xml.parsers import expat
+
 from robot.errors import DataError
-from robot.model import SuiteVisitor
 from robot.utils import ET, ETSource, get_error_message, html_escape
 
 from .executionresult import Result, CombinedResult
@@ -105,17 +106,36 @@ class ExecutionResultBuilder:
         handler = XmlElementHandler(result)
         with self._source as source:
             self._parse(source, handler.start, handler.end)
-        result.handle_suite_teardown_failures()
+        result.handle_suite_teardown_failures(handler.suites_with_failed_teardown)
         if not self._include_keywords:
-            result.suite.visit(RemoveKeywords())
+            self._remove_keywords(result.suite)
         return result
 
+    def _remove_keywords(self, suite):
+        # Suite teardowns and test bodies are not fully omitted during parsing
+        # to allow checking suite teardown status. They are removed here.
+        suites = [suite]
+        while suites:
+            suite = suites.pop()
+            suite.setup = None
+            suite.teardown = None
+            for test in suite.tests:
+                test.body = []
+            suites.extend(suite.suites)
+
     def _parse(self, source, start, end):
-        context = ET.iterparse(source, events=('start', 'end'))
         if not self._include_keywords:
-            context = self._omit_keywords(context)
-        elif self._flattened_keywords:
-            context = self._flatten_keywords(context, self._flattened_keywords)
+            self._parse_expat(source, start, end)
+            return
+        # Separate loops are used instead of filtering events with generators
+        # to avoid the overhead of passing each event through them.
+        context = ET.iterparse(source, events=('start', 'end'))
+        if self._flattened_keywords:
+            self._parse_flatten(context, start, end, self._flattened_keywords)
+        else:
+            self._parse_all(context, start, end)
+
+    def _parse_all(self, context, start, end):
         for event, elem in context:
             if event == 'start':
                 start(elem)
@@ -123,35 +143,122 @@ class ExecutionResultBuilder:
                 end(elem)
                 elem.clear()
 
-    def _omit_keywords(self, context):
-        omitted_kws = 0
-        for event, elem in context:
+    def _parse_expat(self, source, start, end):
+        # When keywords are omitted, expat is used directly instead of iterparse.
+        # That way no elements are created for omitted parts of the XML.
+        if hasattr(source, 'read'):
+            self._parse_expat_file(source, start, end)
+        else:
+            with open(source, 'rb') as file:
+                self._parse_expat_file(file, start, end)
+
+    def _parse_expat_file(self, file, start, end):
+        # Performance optimized. Do not change without profiling!
+        parser = expat.ParserCreate()
+        stack = []
+        text_elem = None    # element whose text is being collected, if any
+        skipped = 0         # depth inside an omitted keyword
+        omitted_tags = frozenset(('kw', 'for', 'if'))
+
+        def start_element(tag, attrib):
+            nonlocal text_elem, skipped
             # Teardowns aren't omitted yet to allow checking suite teardown status.
             # They'll be removed later when not needed in `build()`.
-            omit = elem.tag in ('kw', 'for', 'if') and elem.get('type') != 'TEARDOWN'
-            start = event == 'start'
-            if omit and start:
-                omitted_kws += 1
-            if not omitted_kws:
-                yield event, elem
-            elif not start:
-                elem.clear()
-            if omit and not start:
-                omitted_kws -= 1
+            if tag in omitted_tags and attrib.get('type') != 'TEARDOWN':
+                # Inside omitted keywords only depth is tracked and character
+                # data isn't reported at all.
+                skipped = 1
+                text_elem = None
+                parser.StartElementHandler = skip_start
+                parser.EndElementHandler = skip_end
+                parser.CharacterDataHandler = None
+            else:
+                text_elem = _ExpatElement(tag, attrib)
+                stack.append(text_elem)
+                start(text_elem)
+
+        def end_element(tag):
+            nonlocal text_elem
+            text_elem = None
+            end(stack.pop())
+
+        def character_data(data):
+            if text_elem is not None:
+                if text_elem.text is None:
+                    text_elem.text = data
+                else:
+                    text_elem.text += data
 
-    def _flatten_keywords(self, context, flattened):
+        def skip_start(tag, attrib):
+            nonlocal skipped
+            skipped += 1
+
+        def skip_end(tag):
+            nonlocal skipped
+            skipped -= 1
+            if not skipped:
+                parser.StartElementHandler = start_element
+                parser.EndElementHandler = end_element
+                parser.CharacterDataHandler = character_data
+
+        # Expat silently ignores entities it cannot expand, but ET reports
+        # them as errors. These handlers are called only with such entities.
+        def external_entity_ref(context, base, system_id, public_id):
+            undefined_entity(context)
+
+        def skipped_entity(name, is_parameter_entity):
+            if not is_parameter_entity:
+                undefined_entity(name)
+
+        def undefined_entity(name):
+            line, column = parser.CurrentLineNumber, parser.CurrentColumnNumber
+            err = expat.ExpatError(f'undefined entity &{name};: '
+                                   f'line {line}, column {column}')
+            err.code = 11    # XML_ERROR_UNDEFINED_ENTITY
+            err.lineno = line
+            err.offset = column
+            raise err
+
+        parser.buffer_text = True
+        parser.StartElementHandler = start_element
+        parser.EndElementHandler = end_element
+        parser.CharacterDataHandler = character_data
+        parser.ExternalEntityRefHandler = external_entity_ref
+        parser.SkippedEntityHandler = skipped_entity
+        read = file.read
+        try:
+            while True:
+                data = read(65536)
+                if not data:
+                    break
+                parser.Parse(data, False)
+            parser.Parse(b'', True)
+        except expat.ExpatError as err:
+            # Report errors like ET does to get same errors in all modes.
+            error = ET.ParseError(str(err))
+            error.code = err.code
+            error.position = err.lineno, err.offset
+            raise error
+
+    def _parse_flatten(self, context, start, end, flattened):
         # Performance optimized. Do not change without profiling!
         name_match, by_name = self._get_matcher(FlattenByNameMatcher, flattened)
         type_match, by_type = self._get_matcher(FlattenByTypeMatcher, flattened)
         tags_match, by_tags = self._get_matcher(FlattenByTagMatcher, flattened)
         started = -1    # if 0 or more, we are flattening
         tags = []
-        containers = {'kw', 'for', 'while', 'iter', 'if', 'try'}
+        # Tags are mapped to integer codes once per element to avoid repeated
+        # string comparisons. Tags not listed here get code 0.
+        CONTAINER, MSG, TAG, STATUS = 1, 2, 3, 4
+        codes = {'kw': CONTAINER, 'for': CONTAINER, 'while': CONTAINER,
+                 'iter': CONTAINER, 'if': CONTAINER, 'try': CONTAINER,
+                 'msg': MSG, 'tag': TAG, 'status': STATUS}.get
         inside = 0    # to make sure we don't read tags from a test
         for event, elem in context:
             tag = elem.tag
+            code = codes(tag, 0)
             if event == 'start':
-                if tag in containers:
+                if code == CONTAINER:
                     inside += 1
                     if started >= 0:
                         started += 1
@@ -161,41 +268,54 @@ class ExecutionResultBuilder:
                     elif by_type and type_match(tag):
                         started = 0
                     tags = []
-            else:
-                if tag in containers:
-                    inside -= 1
-                elif by_tags and inside and started < 0 and tag == 'tag':
-                    tags.append(elem.text or '')
-                    if tags_match(tags):
-                        started = 0
-                elif started == 0 and tag == 'status':
-                    elem.text = self._create_flattened_message(elem.text)
-            if started <= 0 or tag == 'msg':
-                yield event, elem
-            else:
-                elem.clear()
-            if started >= 0 and event == 'end' and tag in containers:
+                if started <= 0 or code == MSG:
+                    start(elem)
+                continue
+            if code == CONTAINER:
+                inside -= 1
+            elif code == TAG and by_tags and inside and started < 0:
+                tags.append(elem.text or '')
+                if tags_match(tags):
+                    started = 0
+            elif code == STATUS and started == 0:
+                elem.text = self._create_flattened_message(elem.text)
+            if started <= 0 or code == MSG:
+                end(elem)
+            elem.clear()
+            if started >= 0 and code == CONTAINER:
                 started -= 1
 
     def _create_flattened_message(self, original):
+        # Passing keywords typically have no message, so handle that fast.
         if not original:
-            start = ''
-        elif original.startswith('*HTML*'):
-            start = original[6:].strip() + '<hr>'
+            return '*HTML* <i>Content flattened.</i>'
+        if original.startswith('*HTML*'):
+            start = original[6:].strip()
         else:
-            start = html_escape(original) + '<hr>'
-        return f'*HTML* {start}<i>Content flattened.</i>'
+            start = html_escape(original)
+        return f'*HTML* {start}<hr><i>Content flattened.</i>'
 
     def _get_matcher(self, matcher_class, flattened):
         matcher = matcher_class(flattened)
         return matcher.match, bool(matcher)
 
 
-class RemoveKeywords(SuiteVisitor):
+class _ExpatElement:
+    """Minimal element used when parsing results with expat directly.
+
+    Supports the subset of the ElementTree ``Element`` API that element
+    handlers use.
+    """
+    __slots__ = ('tag', 'attrib', 'text')
+
+    def __init__(self, tag, attrib):
+        self.tag = tag
+        self.attrib = attrib
+        self.text = None
+
+    def get(self, key, default=None):
+        return self.attrib.get(key, default)
 
-    def start_suite(self, suite):
-        suite.setup = None
-        suite.teardown = None
+    def __repr__(self):
+        return f"<Element '{self.tag}'>"
 
-    def visit_test(self, test):
-        test.body = []
@@ -18,13 +18,27 @@ from robot.model import SuiteVisitor
 
 class SuiteTeardownFailureHandler(SuiteVisitor):
 
-    def end_suite(self, suite):
+    @staticmethod
+    def has_failed_teardown(suite):
+        # Both 'PASS' and 'NOT RUN' statuses are OK. `has_teardown` is checked
+        # first to avoid creating teardown objects for suites without them.
+        if not suite.has_teardown:
+            return False
         teardown = suite.teardown
-        # Both 'PASS' and 'NOT RUN' statuses are OK.
-        if teardown and teardown.status == teardown.FAIL:
-            suite.suite_teardown_failed(teardown.message)
-        if teardown and teardown.status == teardown.SKIP:
-            suite.suite_teardown_skipped(teardown.message)
+        return teardown.status in (teardown.FAIL, teardown.SKIP)
+
+    def handle_suites(self, suites):
+        # Handles only the given suites without visiting the whole structure.
+        for suite in suites:
+            self.end_suite(suite)
+
+    def end_suite(self, suite):
+        if self.has_failed_teardown(suite):
+            teardown = suite.teardown
+            if teardown.status == teardown.FAIL:
+                suite.suite_teardown_failed(teardown.message)
+            else:
+                suite.suite_teardown_skipped(teardown.message)
 
     def visit_test(self, test):
         pass
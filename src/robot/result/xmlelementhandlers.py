@@ -17,15 +17,30 @@ from datetime import datetime
 
 from robot.errors import DataError
 
+from .suiteteardownfailed import SuiteTeardownFailureHandler
+
 
 class XmlElementHandler:
 
     def __init__(self, execution_result, root_handler=None):
         self._stack = [(root_handler or RootHandler(), execution_result)]
+        # Child handlers depend only on the parent handler and the tag.
+        # Caching them avoids a method call per element.
+        self._child_handlers = {}
+        self._suite_handler = ElementHandler.element_handlers['suite']
+        self._has_failed_teardown = SuiteTeardownFailureHandler.has_failed_teardown
+        # Suites having a failed or skipped teardown. Collected during parsing
+        # to avoid going through all suites afterwards.
+        self.suites_with_failed_teardown = []
 
     def start(self, elem):
-        handler, result = self._stack[-1]
-        handler = handler.get_child_handler(elem.tag)
+        # Performance optimized. Do not change without profiling!
+        parent, result = self._stack[-1]
+        key = (parent, elem.tag)
+        try:
+            handler = self._child_handlers[key]
+        except KeyError:
+            handler = self._child_handlers[key] = parent.get_child_handler(elem.tag)
         # Previous `result` being `None` means child elements should be ignored.
         if result is not None:
             result = handler.start(elem, result)
@@ -35,6 +50,8 @@ class XmlElementHandler:
         handler, result = self._stack.pop()
         if result is not None:
             handler.end(elem, result)
+            if handler is self._suite_handler and self._has_failed_teardown(result):
+                self.suites_with_failed_teardown.append(result)
 
 
 class ElementHandler:
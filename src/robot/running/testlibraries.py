@@ -16,6 +16,8 @@
 import inspect
 import os
 from functools import partial
+from types import (BuiltinFunctionType, FunctionType, MethodDescriptorType, MethodType,
+                   ModuleType, WrapperDescriptorType)
 
 from robot.errors import DataError
 from robot.libraries import STDLIBS
@@ -49,8 +51,18 @@ def TestLibrary(name, args=None, variables=None, create_handlers=True, logger=LO
     return lib
 
 
+# Common routine types are checked with `isinstance` before falling back to
+# `inspect.isroutine`. This is considerably faster with typical keywords.
+_ROUTINE_TYPES = (FunctionType, MethodType, BuiltinFunctionType,
+                  MethodDescriptorType, WrapperDescriptorType)
+
+
+def _is_routine(obj):
+    return isinstance(obj, _ROUTINE_TYPES) or inspect.isroutine(obj)
+
+
 def _get_lib_class(libcode):
-    if inspect.ismodule(libcode):
+    if isinstance(libcode, ModuleType):
         return _ModuleLibrary
     if GetKeywordNames(libcode):
         if RunKeyword(libcode):
@@ -97,7 +109,7 @@ class _BaseTestLibrary:
 
     @property
     def lineno(self):
-        if inspect.ismodule(self._libcode):
+        if isinstance(self._libcode, ModuleType):
             return 1
         try:
             lines, start_lineno = inspect.getsourcelines(self._libcode)
@@ -139,17 +151,12 @@ class _BaseTestLibrary:
             self.logger.write(f'Details:\n{details}', details_level)
 
     def _get_version(self, libcode):
-        return self._get_attr(libcode, 'ROBOT_LIBRARY_VERSION') \
-            or self._get_attr(libcode, '__version__')
-
-    def _get_attr(self, object, attr, default='', upper=False):
-        value = str(getattr(object, attr, default))
-        if upper:
-            value = normalize(value, ignore='_').upper()
-        return value
+        return (str(getattr(libcode, 'ROBOT_LIBRARY_VERSION', ''))
+                or str(getattr(libcode, '__version__', '')))
 
     def _get_doc_format(self, libcode):
-        return self._get_attr(libcode, 'ROBOT_LIBRARY_DOC_FORMAT', upper=True)
+        doc_format = str(getattr(libcode, 'ROBOT_LIBRARY_DOC_FORMAT', ''))
+        return normalize(doc_format, ignore='_').upper() if doc_format else ''
 
     def _create_init_handler(self, libcode):
         return InitHandler(self, self._resolve_init_method(libcode))
@@ -240,8 +247,9 @@ class _BaseTestLibrary:
             message, details = get_error_details()
             raise DataError(f"Getting keyword names from library '{self.name}' "
                             f"failed: {message}", details)
+        get_method = self._get_handler_method_getter(libcode)
         for name in names:
-            method = self._try_to_get_handler_method(libcode, name)
+            method = self._try_to_get_handler_method(get_method, name)
             if method:
                 handler, embedded = self._try_to_create_handler(name, method)
                 if handler:
@@ -267,9 +275,12 @@ class _BaseTestLibrary:
             predicate = has_robot_name
         return [name for name in dir(libcode) if predicate(name)]
 
-    def _try_to_get_handler_method(self, libcode, name):
+    def _get_handler_method_getter(self, libcode):
+        return partial(self._get_handler_method, libcode)
+
+    def _try_to_get_handler_method(self, get_method, name):
         try:
-            return self._get_handler_method(libcode, name)
+            return get_method(name)
         except DataError as err:
             self._adding_keyword_failed(name, err, self.get_handler_error_level)
             return None
@@ -292,7 +303,7 @@ class _BaseTestLibrary:
 
     def _validate_handler_method(self, method):
         # isroutine returns false for partial objects. This may change in the future.
-        if not (inspect.isroutine(method) or isinstance(method, partial)):
+        if not (_is_routine(method) or isinstance(method, partial)):
             raise DataError('Not a method or function.')
         if getattr(method, 'robot_not_keyword', False):
             raise DataError('Not exposed as a keyword.')
@@ -336,19 +347,33 @@ class _BaseTestLibrary:
 
 class _ClassLibrary(_BaseTestLibrary):
 
-    def _get_handler_method(self, libinst, name):
+    def _get_handler_method_getter(self, libinst):
+        # Names of routines in the instance and its classes are collected once
+        # instead of going through the MRO separately with each name.
+        routine_names = set()
         for item in (libinst,) + inspect.getmro(libinst.__class__):
-            # `isroutine` is used before `getattr` to avoid calling properties.
-            if (name in getattr(item, '__dict__', ())
-                    and inspect.isroutine(item.__dict__[name])):
-                try:
-                    method = getattr(libinst, name)
-                except Exception:
-                    message, traceback = get_error_details()
-                    raise DataError(f'Getting handler method failed: {message}',
-                                    traceback)
-                return self._validate_handler_method(method)
-        raise DataError('Not a method or function.')
+            # Routines are checked before `getattr` to avoid calling properties.
+            routine_names.update(name for name, value
+                                 in getattr(item, '__dict__', {}).items()
+                                 if _is_routine(value))
+        return partial(self._get_handler_method, libinst,
+                       routine_names=routine_names)
+
+    def _get_handler_method(self, libinst, name, routine_names=None):
+        if routine_names is not None:
+            is_routine = name in routine_names
+        else:
+            is_routine = any(name in getattr(item, '__dict__', ())
+                             and _is_routine(item.__dict__[name])
+                             for item in (libinst,) + inspect.getmro(libinst.__class__))
+        if not is_routine:
+            raise DataError('Not a method or function.')
+        try:
+            method = getattr(libinst, name)
+        except Exception:
+            message, traceback = get_error_details()
+            raise DataError(f'Getting handler method failed: {message}', traceback)
+        return self._validate_handler_method(method)
 
 
 class _ModuleLibrary(_BaseTestLibrary):
@@ -0,0 +1,56 @@
+import unittest
+
+from robot.result import Result, TestSuite
+from robot.result.merger import Merger
+from robot.utils.asserts import assert_equal, assert_true
+
+
+def create_result(*tests):
+    suite = TestSuite(name='Root')
+    for name, status in tests:
+        suite.tests.create(name=name, status=status)
+    return Result(root_suite=suite)
+
+
+class TestMerger(unittest.TestCase):
+
+    def setUp(self):
+        self.result = create_result(('A', 'PASS'), ('B', 'FAIL'), ('B', 'FAIL'))
+        self.merger = Merger(self.result)
+
+    def test_new_test(self):
+        self.merger.merge(create_result(('C', 'PASS')))
+        self._verify_tests(('A', 'PASS'), ('B', 'FAIL'), ('B', 'FAIL'), ('C', 'PASS'))
+        assert_equal(self.result.suite.tests[-1].message,
+                     '*HTML* Test added from merged output.')
+
+    def test_replaced_test(self):
+        self.merger.merge(create_result(('A', 'FAIL')))
+        self._verify_tests(('A', 'FAIL'), ('B', 'FAIL'), ('B', 'FAIL'))
+        assert_true('re-executed' in self.result.suite.tests[0].message)
+
+    def test_duplicate_names(self):
+        self.merger.merge(create_result(('B', 'PASS'), ('C', 'PASS'), ('C', 'FAIL')))
+        self._verify_tests(('A', 'PASS'), ('B', 'PASS'), ('B', 'FAIL'), ('C', 'FAIL'))
+        assert_equal(self.result.suite.tests[2].message, '')
+
+    def test_merge_multiple_times(self):
+        self.merger.merge(create_result(('C', 'PASS')))
+        self.merger.merge(create_result(('C', 'FAIL'), ('D', 'PASS')))
+        self._verify_tests(('A', 'PASS'), ('B', 'FAIL'), ('B', 'FAIL'),
+                           ('C', 'FAIL'), ('D', 'PASS'))
+
+    def test_result_modified_between_merges(self):
+        self.merger.merge(create_result(('C', 'PASS')))
+        self.result.suite.tests.pop()
+        self.result.suite.tests.pop(0)
+        self.merger.merge(create_result(('C', 'FAIL'), ('B', 'PASS')))
+        self._verify_tests(('B', 'PASS'), ('B', 'FAIL'), ('C', 'FAIL'))
+
+    def _verify_tests(self, *expected):
+        assert_equal([(t.name, t.status) for t in self.result.suite.tests],
+                     list(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
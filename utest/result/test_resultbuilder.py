@@ -7,7 +7,8 @@ from pathlib import Path
 
 from robot.errors import DataError
 from robot.result import ExecutionResult, ExecutionResultBuilder, Result, TestSuite
-from robot.utils.asserts import assert_equal, assert_false, assert_true, assert_raises
+from robot.utils.asserts import (assert_equal, assert_false, assert_true,
+                                 assert_raises, assert_raises_with_msg)
 
 
 CURDIR = Path(__file__).resolve().parent
@@ -229,6 +230,64 @@ class TestElements(unittest.TestCase):
     def test_unknown_elements_cause_an_error(self):
         assert_raises(DataError, ExecutionResult, StringIO('<some_tag/>'))
 
+    def test_invalid_xml_causes_an_error(self):
+        for include_keywords in True, False:
+            assert_raises_with_msg(
+                DataError,
+                "Reading XML source '<in-memory file>' failed: "
+                "ParseError: mismatched tag: line 1, column 16",
+                ExecutionResult, '<robot><suite></robot>',
+                include_keywords=include_keywords
+            )
+
+    def test_undefined_entities_cause_an_error(self):
+        xml = ('<!DOCTYPE robot [<!ENTITY x SYSTEM "file:///nonex">]>\n'
+               '<robot><suite name="S"><doc>&x;</doc></suite></robot>')
+        for include_keywords in True, False:
+            assert_raises_with_msg(
+                DataError,
+                "Reading XML source '<in-memory file>' failed: "
+                "ParseError: undefined entity &x;: line 2, column 28",
+                ExecutionResult, xml, include_keywords=include_keywords
+            )
+
+
+class TestFlattenKeywords(unittest.TestCase):
+
+    def test_flatten_by_name(self):
+        result = ExecutionResult(StringIO(GOLDEN_XML),
+                                 flattened_keywords=['name:logs on trace'])
+        kw = result.suite.tests[0].body[1]
+        assert_equal(kw.name, 'logs on trace')
+        assert_equal(list(kw.body), [])
+        assert_equal(kw.message, '*HTML* <i>Content flattened.</i>')
+
+    def test_flatten_by_type(self):
+        result = ExecutionResult(StringIO(GOLDEN_XML), flattened_keywords=['for'])
+        for_ = result.suite.tests[0].body[2]
+        assert_equal([msg.message for msg in for_.body], ['not in source'])
+        assert_equal(for_.message, '*HTML* <i>Content flattened.</i>')
+
+    def test_flatten_by_tag(self):
+        result = ExecutionResult(StringIO(GOLDEN_XML),
+                                 flattened_keywords=['tag:tag not in source'])
+        kw = result.suite.tests[0].body[1]
+        assert_equal(list(kw.tags), ['tag not in source'])
+        assert_equal(list(kw.body), [])
+
+    def test_flattened_message(self):
+        xml = GOLDEN_XML.replace(
+            '<status status="PASS" start="2011-10-24T13:41:20.930000" elapsed="0.003"/>',
+            '<status status="FAIL" start="2011-10-24T13:41:20.930000" '
+            'elapsed="0.003">&lt;b&gt; failed</status>'
+        )
+        for original, expected in [('&lt;b&gt; failed', '&lt;b&gt; failed'),
+                                   ('*HTML* &lt;b&gt; failed', '<b> failed')]:
+            result = ExecutionResult(StringIO(xml.replace('&lt;b&gt; failed', original)),
+                                     flattened_keywords=['name:logs on trace'])
+            kw = result.suite.tests[0].body[1]
+            assert_equal(kw.message, f'*HTML* {expected}<hr><i>Content flattened.</i>')
+
 
 class TestSuiteTeardownFailed(unittest.TestCase):
 
@@ -369,6 +428,17 @@ class TestUsingPathlibPath(unittest.TestCase):
         assert_equal(test.starttime, '20111024 13:41:20.925')
         assert_equal(test.endtime, '20111024 13:41:20.934')
 
+    def test_omit_keywords(self):
+        result = ExecutionResult(Path(__file__).parent / 'golden.xml',
+                                 include_keywords=False)
+        test = result.suite.tests[0]
+        assert_equal(test.doc, 'Test case documentation')
+        assert_equal(list(test.tags), ['t1'])
+        assert_equal(len(test.body), 0)
+        assert_equal(result.errors.messages[0].message,
+                     "Error in file 'normal.html' in table 'Settings': "
+                     "Resource file 'nope' does not exist.")
+
     def test_save(self):
         temp = os.getenv('TEMPDIR', tempfile.gettempdir())
         path = Path(temp) / 'pathlib.xml'
@@ -294,6 +294,9 @@ class TestSlots(unittest.TestCase):
         for cls in Break, Continue, Return:
             self._verify(cls())
 
+    def test_var(self):
+        self._verify(Var())
+
     def test_error(self):
         self._verify(Error())
 